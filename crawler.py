@@ -1,15 +1,33 @@
+import asyncio
+import atexit
+import csv
+import itertools
+import json
+import math
+import os
+import queue
 import time
 import getpass
-from typing import List, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Iterator, List, Dict, Optional, Tuple
 
-import pandas as pd
+import httpx
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import (
+    StaleElementReferenceException,
+    TimeoutException,
+)
 from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.common.action_chains import ActionChains
+from selenium.webdriver.remote.remote_connection import RemoteConnection
+from selenium.webdriver.remote.webelement import WebElement
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 
@@ -20,6 +38,263 @@ from selenium.webdriver.common.action_chains import ActionChains
 DEFAULT_PRODUCT_URL = "https://kream.co.kr/products/83900"
 DEFAULT_OUTPUT_FILE = "kream_83900.xlsx"
 
+# JSON endpoint that populates the trade-history modal (found via the
+# DevTools Network tab). Much cheaper to call directly than rendering
+# and scrolling the modal in a real browser.
+TRADES_API_URL = "https://kream.co.kr/api/products/{product_id}/trades"
+
+# Login endpoint the React form posts to. One direct HTTPS POST replaces
+# the whole browser form-fill/submit dance.
+LOGIN_API_URL = "https://kream.co.kr/api/auth/login"
+
+# Cookies that indicate a live logged-in session, and where cookies are
+# cached between runs so even a cold browser can skip the login flow.
+SESSION_COOKIE_NAMES = ("KREAM_SESSION_ID", "CSRF-TOKEN", "access_token")
+COOKIE_CACHE_FILE = os.path.join(os.path.expanduser("~"), ".kream_cookies.json")
+
+API_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=10)
+API_MAX_CONCURRENCY = 5
+API_HEADERS = {
+    "Accept": "application/json",
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36"
+    ),
+}
+
+# urllib3 pool size for WebDriver commands. The default pool of 1 serializes
+# every command to chromedriver and can drop connections under load.
+WEBDRIVER_POOL_MAXSIZE = 20
+
+
+# =============================
+# Locators
+# =============================
+
+# Shared locator tuples, defined once so hot paths don't rebuild the same
+# selector strings per call. CSS is preferred where possible: chromedriver
+# evaluates it natively via querySelectorAll, while XPath goes through a
+# slower injected evaluator.
+
+# CSS can't match text, so the '로그인' check happens in Python over the
+# few top_link anchors (see login_kream)
+LOGIN_LINK = (By.CSS_SELECTOR, "a.top_link")
+EMAIL_INPUT = (
+    By.CSS_SELECTOR,
+    "input[type='email'][placeholder*='kream@kream.co.kr']",
+)
+PASSWORD_INPUT = (By.CSS_SELECTOR, "input[type='password']")
+# Finds the '자세히' text, resolves its clickable ancestor, scrolls it into
+# view, and clicks — all in one script round-trip. CSS can't match on text,
+# so the text check lives in JS instead of an XPath walk.
+CLICK_DETAILS_JS = """
+    const p = Array.from(document.querySelectorAll('p.text-lookup'))
+        .find(e => e.innerText.trim().includes('자세히'));
+    if (!p) return false;
+    const clickable = p.closest("button, a, [role='button']") || p;
+    clickable.scrollIntoView({block: 'center'});
+    clickable.click();
+    return true;
+"""
+# True once the trade-history modal's title text is on the page — a
+# single script round-trip per poll instead of a full XPath text walk.
+MODAL_TITLE_JS = """
+    const text = document.body.textContent;
+    return ['체결 거래', '거래 및 입찰 내역', '거래 내역']
+        .some(t => text.includes(t));
+"""
+PRICE_TABLE_CSS = "div.market_price_table"
+PRICE_TABLE = (By.CSS_SELECTOR, PRICE_TABLE_CSS)
+
+
+# =============================
+# Record layout
+# =============================
+
+# Trade records are kept as three parallel lists rather than a dict per
+# row: pd.DataFrame(columns_dict) takes the fast columnar path, and we
+# skip a ~200-byte dict allocation per row.
+TradeColumns = Dict[str, List]
+
+
+def _new_trade_columns() -> TradeColumns:
+    return {"size": [], "price": [], "date": []}
+
+
+@lru_cache(maxsize=64)
+def _normalize_url(url: Optional[str]) -> str:
+    """
+    Strip query parameters and trailing slashes to make URL comparisons
+    more forgiving when checking navigation state. Cached because the
+    same handful of URLs is re-checked on every navigation poll.
+    """
+    if not url:
+        return ""
+    return url.split("?", 1)[0].rstrip("/")
+
+
+def _normalize_trade_frame(df: "pd.DataFrame") -> "pd.DataFrame":
+    """
+    Clean the raw scraped strings in one vectorized pass: prices become
+    int64 ('209,000원' -> 209000), dates become datetimes, and sizes use
+    the category dtype (repeated values share one object).
+    """
+    import pandas as pd
+    df["price"] = (
+        df["price"]
+        .astype(str)
+        .str.replace(r"[^\d]", "", regex=True)
+        .replace("", "0")
+        .astype("int64")
+    )
+    dates = pd.to_datetime(df["date"], format="%y/%m/%d", errors="coerce")
+    if dates.isna().all():
+        # API timestamps aren't in the modal's yy/mm/dd format
+        dates = pd.to_datetime(df["date"], errors="coerce")
+    if isinstance(dates.dtype, pd.DatetimeTZDtype):
+        # Excel can't store tz-aware datetimes
+        dates = dates.dt.tz_localize(None)
+    df["date"] = dates
+    df["size"] = df["size"].astype("category")
+    return df
+
+
+def _raise_webdriver_pool_maxsize(maxsize: int = WEBDRIVER_POOL_MAXSIZE) -> None:
+    """
+    Bump the urllib3 connection pool used for WebDriver commands so the
+    many small find/script calls don't serialize on a single connection.
+    Safe to call repeatedly; only patches once.
+    """
+    if getattr(RemoteConnection, "_pool_maxsize_raised", False):
+        return
+
+    original = RemoteConnection._get_connection_manager
+
+    def _get_connection_manager(self):
+        manager = original(self)
+        manager.connection_pool_kw["maxsize"] = maxsize
+        manager.connection_pool_kw["block"] = False
+        return manager
+
+    RemoteConnection._get_connection_manager = _get_connection_manager
+    RemoteConnection._pool_maxsize_raised = True
+
+
+# =============================
+# Browser pool
+# =============================
+
+# Warm Chrome instances kept alive across crawl_product calls, so repeat
+# crawls skip the 1-2s Chromium cold start. The pool is capped at the
+# core count; idle browsers beyond that are quit rather than parked.
+_POOL_MAX_SIZE = os.cpu_count() or 4
+_BROWSER_POOL: "queue.Queue[webdriver.Chrome]" = queue.Queue()
+
+
+def _build_chrome_options() -> webdriver.ChromeOptions:
+    options = webdriver.ChromeOptions()
+
+    # Headless with a trimmed flag set: faster startup, much lower RSS.
+    # The tall fixed viewport makes the infinite-scroll modal load more
+    # rows per scroll (no --start-maximized; it's meaningless headless).
+    for arg in (
+        "--headless=new",
+        "--disable-gpu",
+        "--no-sandbox",
+        "--disable-extensions",
+        "--disable-background-networking",
+        "--disable-sync",
+        "--mute-audio",
+        "--window-size=1400,2200",
+    ):
+        options.add_argument(arg)
+
+    # Return from driver.get() on DOMContentLoaded instead of waiting for
+    # every image/font/beacon — the crawler only reads the DOM.
+    options.page_load_strategy = "eager"
+
+    # Skip images entirely; keep stylesheets since the table layout (and
+    # some visibility checks) depend on CSS.
+    options.add_experimental_option(
+        "prefs",
+        {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.managed_default_content_settings.stylesheets": 1,
+            "profile.default_content_setting_values.notifications": 2,
+        },
+    )
+    options.add_argument("--blink-settings=imagesEnabled=false")
+    options.add_argument("--disable-features=Translate,MediaRouter")
+    options.add_argument("--disable-dev-shm-usage")
+
+    # Capture CDP network events so the trade JSON the browser already
+    # fetched for the modal can be read back without re-requesting it.
+    options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    return options
+
+
+# Request patterns the crawler never reads: block them at the network
+# layer as a second line of defense behind the image prefs.
+_BLOCKED_URL_PATTERNS = ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.woff2",
+                         "*google-analytics*"]
+
+
+def _spawn_driver() -> webdriver.Chrome:
+    _raise_webdriver_pool_maxsize()
+    driver = webdriver.Chrome(options=_build_chrome_options())
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd(
+            "Network.setBlockedURLs", {"urls": _BLOCKED_URL_PATTERNS}
+        )
+    except Exception:
+        pass  # non-Chromium driver; prefs/flags still cover images
+    return driver
+
+
+@contextmanager
+def get_driver() -> Iterator[webdriver.Chrome]:
+    """
+    Check a warm Chrome out of the process-level pool (spawning one if the
+    pool is empty) and return it on exit with cookies/URL reset, so the
+    next job starts from a clean slate without paying browser startup.
+    """
+    try:
+        driver = _BROWSER_POOL.get_nowait()
+    except queue.Empty:
+        driver = _spawn_driver()
+
+    try:
+        yield driver
+    finally:
+        try:
+            driver.delete_all_cookies()
+            driver.get("about:blank")
+        except Exception:
+            # Driver is unusable (crashed tab, dead session) — don't pool it.
+            try:
+                driver.quit()
+            except Exception:
+                pass
+        else:
+            if _BROWSER_POOL.qsize() < _POOL_MAX_SIZE:
+                _BROWSER_POOL.put(driver)
+            else:
+                driver.quit()
+
+
+@atexit.register
+def _shutdown_browser_pool() -> None:
+    while True:
+        try:
+            driver = _BROWSER_POOL.get_nowait()
+        except queue.Empty:
+            break
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
 
 # =============================
 # Core crawler
@@ -31,17 +306,72 @@ class KreamCrawler:
         self.product_url = product_url
         self.email = email
         self.password = password
-        self.wait = WebDriverWait(self.driver, 15)
+        # The default 0.5s poll adds up to half a second of dead time per
+        # wait; all our conditions are cheap (single command or script),
+        # so poll at 0.1s across the board.
+        self.wait = WebDriverWait(self.driver, 15, poll_frequency=0.1)
+        self.wait_nav = WebDriverWait(self.driver, 15, poll_frequency=0.1)
+        # For local predicates that should give up quickly (element state
+        # probes) rather than burn the full 15s budget
+        self.wait_fast = WebDriverWait(self.driver, 5, poll_frequency=0.05)
+        # Memoized handle on the trade-history table (see _get_price_table)
+        self._table_el: Optional[WebElement] = None
+        # Per-instance element memo (see _find_cached)
+        self._el_cache: Dict[str, WebElement] = {}
+
+    def _find_cached(
+        self, key: str, locator: Tuple[str, str], force: bool = False
+    ) -> WebElement:
+        """
+        find_element with a per-instance memo: repeated lookups of the
+        same logical element skip the WebDriver round-trip. Pass
+        force=True after catching a StaleElementReferenceException to
+        re-find and refresh the cache.
+        """
+        if force or key not in self._el_cache:
+            self._el_cache[key] = self.driver.find_element(*locator)
+        return self._el_cache[key]
 
-    @staticmethod
-    def _normalize_url(url: Optional[str]) -> str:
+    def _wait_dom_quiet(
+        self, selector: str, quiet_ms: int = 300, timeout_ms: int = 5000
+    ) -> bool:
+        """
+        Block until the subtree under `selector` (or <body> if it doesn't
+        match) has gone `quiet_ms` without a DOM mutation, or `timeout_ms`
+        elapses. Event-driven replacement for fixed time.sleep() pauses:
+        returns as soon as the page actually settles.
         """
-        Strip query parameters and trailing slashes to make URL comparisons
-        more forgiving when checking navigation state.
+        script = """
+            const selector = arguments[0];
+            const quietMs = arguments[1];
+            const timeoutMs = arguments[2];
+            const done = arguments[arguments.length - 1];
+
+            const target = document.querySelector(selector) || document.body;
+            const observer = new MutationObserver(() => {
+                clearTimeout(timer);
+                timer = setTimeout(finish, quietMs);
+            });
+            function finish() {
+                observer.disconnect();
+                clearTimeout(timer);
+                clearTimeout(deadline);
+                done(true);
+            }
+            let timer = setTimeout(finish, quietMs);
+            const deadline = setTimeout(finish, timeoutMs);
+            observer.observe(target, {
+                childList: true, subtree: true, characterData: true,
+            });
         """
-        if not url:
-            return ""
-        return url.split("?", 1)[0].rstrip("/")
+        try:
+            return bool(
+                self.driver.execute_async_script(
+                    script, selector, quiet_ms, timeout_ms
+                )
+            )
+        except TimeoutException:
+            return False
 
     def _navigate_if_needed(self, target_url: Optional[str]) -> None:
         """
@@ -51,16 +381,22 @@ class KreamCrawler:
         if not target_url:
             return
 
-        desired = self._normalize_url(target_url)
-        current = self._normalize_url(self.driver.current_url)
+        desired = _normalize_url(target_url)
+        current = _normalize_url(self.driver.current_url)
         if desired and desired == current:
             return
 
         print(f"[navigation] Navigating to {target_url}")
         self.driver.get(target_url)
         try:
-            self.wait.until(
-                lambda d: self._normalize_url(d.current_url) == desired
+            # location.href via a script call is cheaper than the
+            # current_url command, and this lambda runs on every poll —
+            # bind the normalizer to a local so each poll skips the
+            # attribute lookup too
+            normalize = _normalize_url
+            self.wait_nav.until(
+                lambda d: normalize(d.execute_script("return location.href"))
+                == desired
             )
         except TimeoutException:
             print(
@@ -69,13 +405,67 @@ class KreamCrawler:
             )
 
 
+    def _session_active(self) -> bool:
+        """True when the driver already holds a logged-in KREAM session."""
+        if "kream.co.kr" not in self.driver.current_url:
+            return False
+        names = {c["name"] for c in self.driver.get_cookies()}
+        if not names.intersection(SESSION_COOKIE_NAMES):
+            return False
+        # Probe: the top '로그인' link disappears once logged in
+        return not any(
+            "로그인" in (el.text or "")
+            for el in self.driver.find_elements(*LOGIN_LINK)
+        )
+
+    def _save_session_cookies(self) -> None:
+        """Cache the session cookies so later runs can skip login."""
+        try:
+            with open(COOKIE_CACHE_FILE, "w") as f:
+                json.dump(self.driver.get_cookies(), f)
+        except OSError as e:
+            print(f"[login_kream] Could not cache cookies ({e})")
+
+    def _restore_session_cookies(self) -> bool:
+        """Load cached cookies into the driver. True if any were loaded."""
+        try:
+            with open(COOKIE_CACHE_FILE) as f:
+                cookies = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if not cookies:
+            return False
+        # add_cookie requires the browser to already be on the domain
+        if "kream.co.kr" not in self.driver.current_url:
+            self.driver.get("https://kream.co.kr")
+        for cookie in cookies:
+            try:
+                self.driver.add_cookie(cookie)
+            except Exception:
+                continue  # expired/malformed entries are just skipped
+        return True
+
+    def _login_via_api(self) -> Dict[str, str]:
+        """
+        Post the credentials straight to the login endpoint and return
+        the resulting session cookies, skipping the browser form.
+        """
+        with httpx.Client(http2=True, headers=API_HEADERS) as client:
+            response = client.post(
+                LOGIN_API_URL,
+                json={"email": self.email, "password": self.password},
+            )
+            response.raise_for_status()
+            return dict(response.cookies)
+
     def login_kream(self, redirect_to: Optional[str] = None) -> None:
         """
         Ensure we're logged into KREAM using the email/password
         stored on this KreamCrawler instance.
 
         Flow:
-        - Go (or redirect) to /login.
+        - Try the login API directly and inject its cookies into the driver.
+        - Otherwise fall back to the form: go (or redirect) to /login.
         - Wait for the real React form to fully load.
         - Fill email/password (and re-fill if React wipes them).
         - Submit via ENTER on password.
@@ -90,17 +480,49 @@ class KreamCrawler:
 
         print("[login_kream] current url:", self.driver.current_url)
 
+        # 0) A reused driver (or a cookie cache from an earlier run) may
+        # already hold a live session — skip the entire login if so.
+        if self._session_active() or (
+            self._restore_session_cookies() and self._session_active()
+        ):
+            print("[login_kream] Session already active, skipping login.")
+            self._navigate_if_needed(redirect_to or self.product_url)
+            return
+
+        # 0.1) Fast path: log in over plain HTTPS and hand the session
+        # cookies to the browser. Saves the React render wait, the form
+        # fill, and both page loads.
+        try:
+            cookies = self._login_via_api()
+        except Exception as e:
+            print(f"[login_kream] API login failed ({e}), falling back to form login.")
+            cookies = None
+
+        if cookies:
+            # add_cookie requires the browser to already be on the domain
+            if "kream.co.kr" not in self.driver.current_url:
+                self.driver.get("https://kream.co.kr")
+            for name, value in cookies.items():
+                self.driver.add_cookie(
+                    {"name": name, "value": value, "domain": ".kream.co.kr"}
+                )
+            print("[login_kream] Logged in via API, cookies injected.")
+            self._save_session_cookies()
+            self._navigate_if_needed(redirect_to or self.product_url)
+            return
+
         # 1) Try clicking '로그인' link if present (usually on product/main pages)
         try:
-            login_link = self.driver.find_element(
-                By.XPATH,
-                "//a[contains(@class, 'top_link') and contains(normalize-space(.), '로그인')]",
+            login_link = next(
+                el
+                for el in self.driver.find_elements(*LOGIN_LINK)
+                if "로그인" in (el.text or "")
             )
             print("[login_kream] Found top 로그인 link, clicking it...")
             self.driver.execute_script(
                 "arguments[0].scrollIntoView({block: 'center'});", login_link
             )
-            time.sleep(0.3)
+            self.wait_fast.until(EC.element_to_be_clickable(login_link))
             login_link.click()
         except Exception:
             print("[login_kream] No top 로그인 link found (maybe already on /login).")
@@ -112,19 +534,13 @@ class KreamCrawler:
 
         print("[login_kream] Now at:", self.driver.current_url)
 
-        # *** IMPORTANT: give React time to fully render the real form ***
-        time.sleep(2.5)
-
-        # 3) Locate email & password inputs (using the HTML you gave)
-        email_input = self.wait.until(
-            EC.presence_of_element_located(
-                (
-                    By.XPATH,
-                    "//input[@type='email' and contains(@placeholder, 'kream@kream.co.kr')]",
-                )
-            )
-        )
-        password_input = self.driver.find_element(By.XPATH, "//input[@type='password']")
+        # 3) Locate email & password inputs (using the HTML you gave).
+        # Waiting until they're clickable covers the React render delay
+        # without a fixed sleep.
+        email_input = self.wait.until(EC.element_to_be_clickable(EMAIL_INPUT))
+        password_input = self.wait.until(EC.element_to_be_clickable(PASSWORD_INPUT))
+        self._el_cache["email_input"] = email_input
+        self._el_cache["password_input"] = password_input
 
         # 4) Fill email and password
         print("[login_kream] Filling in email and password...")
@@ -133,27 +549,44 @@ class KreamCrawler:
         password_input.clear()
         password_input.send_keys(password)
 
-        # 4.1) Wait a bit to see if React wipes the values, and re-fill once if needed
-        time.sleep(1.0)
+        # 4.1) Check whether React wipes the values, and re-fill once if
+        # needed. The wait exits as soon as the values stick, instead of
+        # always burning a fixed pause.
+        def _values_stick(_driver: webdriver.Chrome) -> bool:
+            return (
+                email_input.get_attribute("value") == email
+                and bool(password_input.get_attribute("value"))
+            )
+
+        try:
+            WebDriverWait(self.driver, 1.5, poll_frequency=0.1).until(_values_stick)
+        except TimeoutException:
+            pass
+        except StaleElementReferenceException:
+            # DOM re-rendered under us — this is the only case that needs
+            # a re-find; a plain value wipe keeps the same elements.
+            print("[login_kream] Inputs went stale, re-finding...")
+            email_input = self._find_cached("email_input", EMAIL_INPUT, force=True)
+            password_input = self._find_cached(
+                "password_input", PASSWORD_INPUT, force=True
+            )
+
         current_email_val = email_input.get_attribute("value")
         current_pw_val = password_input.get_attribute("value")
         print(f"[login_kream] After typing, email value: {current_email_val!r}")
 
         if current_email_val != email or not current_pw_val:
             print("[login_kream] Detected cleared/changed inputs, re-filling once...")
-            # Re-find inputs (in case DOM re-rendered)
-            email_input = self.driver.find_element(
-                By.XPATH,
-                "//input[@type='email' and contains(@placeholder, 'kream@kream.co.kr')]",
-            )
-            password_input = self.driver.find_element(
-                By.XPATH, "//input[@type='password']"
-            )
             email_input.clear()
             email_input.send_keys(email)
             password_input.clear()
             password_input.send_keys(password)
-            time.sleep(0.8)
+            try:
+                WebDriverWait(self.driver, 1.5, poll_frequency=0.1).until(
+                    _values_stick
+                )
+            except TimeoutException:
+                print("[login_kream] Inputs still unstable after re-fill.")
 
         # 5) Submit the form via ENTER on the password field
         print("[login_kream] Submitting login form via ENTER on password...")
@@ -171,6 +604,9 @@ class KreamCrawler:
             )
             logged_in = "kream.co.kr/login" not in self.driver.current_url
 
+        if logged_in:
+            self._save_session_cookies()
+
         # 7) Optionally redirect straight to the desired page (usually the product)
         target_after_login = redirect_to or self.product_url
         if target_after_login and logged_in:
@@ -198,25 +634,25 @@ class KreamCrawler:
         # Step 2: ensure product page is open (safety net)
         print("[open_product_and_modal] Step 2: ensure product page is open")
         self._navigate_if_needed(self.product_url)
-        time.sleep(2.0)
+        self._wait_dom_quiet("body", quiet_ms=300, timeout_ms=3000)
         print("[open_product_and_modal] now at:", self.driver.current_url)
 
-        # Step 3: click "자세히" on the product page
+        # Step 3: click "자세히" on the product page. Network events are
+        # enabled first so the modal's XHR can be read back over CDP.
         print("[open_product_and_modal] Step 3: click '자세히'")
+        try:
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            # Drain events accumulated during login/navigation so the
+            # post-click capture only scans responses triggered by the
+            # modal itself.
+            self.driver.get_log("performance")
+        except Exception:
+            pass  # non-Chromium driver; CDP capture just won't be available
         self._click_details_button()
 
         # Step 4: wait for trade history modal to appear
         try:
-            self.wait.until(
-                EC.visibility_of_element_located(
-                    (
-                        By.XPATH,
-                        "//*[contains(text(), '체결 거래') or "
-                        "contains(text(), '거래 및 입찰 내역') or "
-                        "contains(text(), '거래 내역')]",
-                    )
-                )
-            )
+            self.wait.until(lambda d: d.execute_script(MODAL_TITLE_JS))
             print("[open_product_and_modal] Trade history modal detected.")
         except TimeoutException:
             print("⚠️ Could not confirm that the trade history modal is open.")
@@ -225,59 +661,93 @@ class KreamCrawler:
 
     def _click_details_button(self) -> None:
         """Click the '자세히' button on the right side."""
+        print("[_click_details_button] Clicking '자세히' via in-page script...")
         try:
-            print("[_click_details_button] Looking for '자세히' text element...")
-            # First, locate the <p> element with the text '자세히'
-            details_text = self.wait.until(
-                EC.presence_of_element_located(
-                    (
-                        By.XPATH,
-                        "//p[contains(@class, 'text-lookup') and contains(normalize-space(.), '자세히')]",
-                    )
-                )
-            )
+            # One script locates the text, scrolls, and clicks; the wait
+            # just re-runs it until the React page has rendered the button.
+            self.wait.until(lambda d: d.execute_script(CLICK_DETAILS_JS))
+        except TimeoutException:
+            raise RuntimeError("Could not find the '자세히' button.")
 
-            # Scroll into view
-            self.driver.execute_script(
-                "arguments[0].scrollIntoView({block: 'center'});", details_text
-            )
-            time.sleep(0.5)
+        # No settle wait here: the caller's modal-title wait is the one
+        # post-click readiness check.
+        print("[_click_details_button] Click on '자세히' attempted.")
 
-            # Try to find a clickable ancestor: button, a, or role='button'
-            clickable = None
-            try:
-                clickable = details_text.find_element(
-                    By.XPATH,
-                    "./ancestor::*[self::button or self::a or @role='button'][1]",
-                )
-                print("[_click_details_button] Found clickable ancestor element.")
-            except Exception:
-                print(
-                    "[_click_details_button] No clickable ancestor found, "
-                    "using the <p> element itself."
-                )
-                clickable = details_text
 
-            # Try an ActionChains click first (more human-like)
-            try:
-                print("[_click_details_button] Trying ActionChains click...")
-                actions = ActionChains(self.driver)
-                actions.move_to_element(clickable).click().perform()
-            except Exception as e:
-                print(f"[_click_details_button] ActionChains click failed: {e}")
-                print("[_click_details_button] Falling back to JS click...")
-                self.driver.execute_script("arguments[0].click();", clickable)
+    # ---------- SCROLLING & SCRAPING ----------
 
-            time.sleep(1.5)
-            print("[_click_details_button] Click on '자세히' attempted.")
+    def _modal_total_count(self, container: WebElement) -> Optional[int]:
+        """
+        Read the total trade count from the modal header ('1,234건'), or
+        None when the header doesn't show one.
+        """
+        return self.driver.execute_script(
+            r"""
+            const scope = arguments[0].closest("[role='dialog'], .layer")
+                || arguments[0].parentElement || document.body;
+            const m = scope.textContent.match(/([\d,]+)\s*건/);
+            return m ? parseInt(m[1].replace(/,/g, ''), 10) : null;
+            """,
+            container,
+        )
 
-        except TimeoutException:
-            raise RuntimeError("Could not find the '자세히' button.")
+    def _scroll_modal_to_end(self, container: WebElement) -> None:
+        """
+        The trade-history modal is an internal scroller that loads rows
+        lazily, so only the first batch is in the DOM when it opens.
+        When the header exposes the total trade count, scroll exactly the
+        number of times needed; otherwise scroll the container itself
+        (not the window) until its scrollHeight stops growing — a single
+        cheap int round-trip per iteration.
+        """
+        total = self._modal_total_count(container)
+        if total:
+            batch = self.driver.execute_script(
+                "return arguments[0].querySelectorAll("
+                "'div.price_body div.body_list').length",
+                container,
+            )
+            if batch:
+                # The exact scroll count is known up front, so skip the
+                # sentinel iteration (one extra scroll + wait) entirely.
+                for _ in range(math.ceil(total / batch) - 1):
+                    self.driver.execute_script(
+                        "arguments[0].scrollTo(0, arguments[0].scrollHeight)",
+                        container,
+                    )
+                    self._wait_dom_quiet(
+                        PRICE_TABLE_CSS, quiet_ms=200, timeout_ms=1500
+                    )
+                return
 
+        last_height = 0
+        while True:
+            height = self.driver.execute_script(
+                "return arguments[0].scrollHeight", container
+            )
+            if height == last_height:
+                break
+            last_height = height
+            self.driver.execute_script(
+                "arguments[0].scrollTo(0, arguments[0].scrollHeight)", container
+            )
+            self._wait_dom_quiet(
+                PRICE_TABLE_CSS, quiet_ms=200, timeout_ms=1500
+            )
 
-    # ---------- SCROLLING & SCRAPING ----------
+    def _get_price_table(self, force: bool = False) -> WebElement:
+        """
+        Locate the market_price_table once and reuse the handle on later
+        calls, skipping a full wait/find round-trip. Pass force=True to
+        re-find after the modal re-rendered (stale element).
+        """
+        if force or self._table_el is None:
+            self._table_el = self.wait.until(
+                EC.presence_of_element_located(PRICE_TABLE)
+            )
+        return self._table_el
 
-    def scrape_trade_history(self) -> List[Dict[str, str]]:
+    def scrape_trade_history(self) -> TradeColumns:
         """
         Scrape trade rows (size / price / date) from the market_price_table.
 
@@ -289,59 +759,268 @@ class KreamCrawler:
                 <div class="list_txt"><span>PRICE</span></div>
                 <div class="list_txt"><span>DATE/TIME</span></div>
         """
-        # Give the UI a bit of time after clicking '자세히'
-        time.sleep(1.5)
+        # Let the list settle after clicking '자세히' (event-driven, so this
+        # returns as soon as the modal stops mutating)
+        self._wait_dom_quiet(PRICE_TABLE_CSS, quiet_ms=300, timeout_ms=5000)
 
-        # 1) Find the main container for the trade list
-        container = self.wait.until(
-            EC.presence_of_element_located(
-                (By.CSS_SELECTOR, "div.market_price_table")
-            )
+        # 1) Find (or reuse) the main container for the trade list
+        container = self._get_price_table()
+
+        # 2) Load the full history into the DOM before extracting
+        try:
+            self._scroll_modal_to_end(container)
+        except StaleElementReferenceException:
+            # Modal re-rendered since the handle was cached — re-find once
+            container = self._get_price_table(force=True)
+            self._scroll_modal_to_end(container)
+
+        # 3) Serialize every row in one script call. Walking the rows from
+        # Python costs one WebDriver round-trip per cell; this is a single
+        # round-trip for the whole table.
+        data = self.driver.execute_script(
+            """
+            // Plain class/tag lookups skip the CSS selector-parsing path;
+            // every row has exactly one span per list_txt cell.
+            const rows = arguments[0].getElementsByClassName('body_list');
+            const out = [];
+            const n = rows.length;
+            for (let i = 0; i < n; i++) {
+                const cells = rows[i].getElementsByTagName('span');
+                if (cells.length < 3) continue;
+                const texts = [
+                    cells[0].textContent.trim(),
+                    cells[1].textContent.trim(),
+                    cells[2].textContent.trim(),
+                ];
+                if (texts.some(Boolean)) out.push(texts);
+            }
+            return out;
+            """,
+            container,
         )
 
-        # 2) Each row is a body_list
-        rows = container.find_elements(By.CSS_SELECTOR, "div.price_body div.body_list")
+        # Rows come back as lightweight [size, price, date] triples; one
+        # zip transposes them into the columnar layout with no per-row
+        # dict or append work.
+        records = _new_trade_columns()
+        if data:
+            sizes, prices, dates = zip(*((c[0], c[1], c[2]) for c in data))
+            records["size"] = list(sizes)
+            records["price"] = list(prices)
+            records["date"] = list(dates)
+
+        print(f"[scrape_trade_history] Collected {len(records['size'])} rows.")
+        return records
 
-        records: List[Dict[str, str]] = []
 
-        for row in rows:
-            try:
-                # Each row has three list_txt blocks with <span>text</span>
-                cells = row.find_elements(By.CSS_SELECTOR, "div.list_txt span")
-                if len(cells) < 3:
-                    continue
+    # ---------- JSON API SCRAPE ----------
 
-                size = cells[0].text.strip()
-                price = cells[1].text.strip()
-                date = cells[2].text.strip()
+    @property
+    def product_id(self) -> str:
+        """Extract the numeric product id from the product URL."""
+        return _normalize_url(self.product_url).rsplit("/", 1)[-1]
 
-                if not size and not price and not date:
-                    continue
+    def _session_cookies(self) -> Dict[str, str]:
+        """Collect the logged-in session cookies from the Selenium driver."""
+        return {c["name"]: c["value"] for c in self.driver.get_cookies()}
 
-                records.append(
-                    {
-                        "size": size,
-                        "price": price,
-                        "date": date,
-                    }
-                )
-            except Exception:
-                # Skip weird/incomplete rows
+    @staticmethod
+    def _parse_trade_items(payload: Any) -> TradeColumns:
+        """
+        Turn one page of the trades API response into the same columnar
+        size/price/date batch that the DOM scrape produces.
+        """
+        if isinstance(payload, dict):
+            items = payload.get("items") or payload.get("trades") or []
+        elif isinstance(payload, list):
+            items = payload
+        else:
+            items = []
+
+        records = _new_trade_columns()
+        for item in items:
+            if not isinstance(item, dict):
                 continue
+            records["size"].append(str(item.get("size", "")).strip())
+            records["price"].append(str(item.get("price", "")).strip())
+            records["date"].append(
+                str(item.get("date") or item.get("created_at", "")).strip()
+            )
+        return records
+
+    @staticmethod
+    def _total_pages(payload: Any, per_page: int) -> Optional[int]:
+        """Read the total trade count from a page payload, if the API exposes it."""
+        if not isinstance(payload, dict) or per_page <= 0:
+            return None
+        total = payload.get("total") or payload.get("total_count")
+        if isinstance(total, int) and total > 0:
+            return math.ceil(total / per_page)
+        return None
+
+    async def _fetch_page(
+        self,
+        client: httpx.AsyncClient,
+        sem: asyncio.Semaphore,
+        url: str,
+        page: int,
+    ) -> TradeColumns:
+        """Fetch and parse one trades page, bounded by the shared semaphore."""
+        async with sem:
+            response = await client.get(url, params={"page": page})
+            response.raise_for_status()
+            return self._parse_trade_items(response.json())
+
+    async def _fetch_trades_async(self) -> TradeColumns:
+        """
+        Fetch all trade-history pages straight from the JSON endpoint,
+        reusing one pooled keep-alive connection instead of driving the
+        browser through the modal. Pages after the first are fetched
+        concurrently (bounded by API_MAX_CONCURRENCY).
+        """
+        url = TRADES_API_URL.format(product_id=self.product_id)
+
+        async with httpx.AsyncClient(
+            limits=API_LIMITS,
+            http2=True,
+            headers=API_HEADERS,
+            cookies=self._session_cookies(),
+        ) as client:
+            sem = asyncio.Semaphore(API_MAX_CONCURRENCY)
+
+            # Page 1 is fetched alone: it tells us whether there is any
+            # data at all, and (when the API exposes a total) how many
+            # pages remain.
+            response = await client.get(url, params={"page": 1})
+            response.raise_for_status()
+            payload = response.json()
+            first = self._parse_trade_items(payload)
+            if not first["size"]:
+                return first
+
+            total_pages = self._total_pages(payload, per_page=len(first["size"]))
+            if total_pages is not None:
+                tasks = [
+                    self._fetch_page(client, sem, url, page)
+                    for page in range(2, total_pages + 1)
+                ]
+                pages = await asyncio.gather(*tasks)
+            else:
+                # No total available: probe in concurrent batches until a
+                # batch contains an empty page.
+                pages = []
+                page = 2
+                while True:
+                    batch = await asyncio.gather(
+                        *[
+                            self._fetch_page(client, sem, url, p)
+                            for p in range(page, page + API_MAX_CONCURRENCY)
+                        ]
+                    )
+                    pages.extend(batch)
+                    if any(not b["size"] for b in batch):
+                        break
+                    page += API_MAX_CONCURRENCY
+
+        records = first
+        for column in records:
+            records[column] = list(
+                itertools.chain(records[column], *(p[column] for p in pages))
+            )
+        return records
+
+    def collect_trades_from_cdp(self, timeout: float = 5.0) -> TradeColumns:
+        """
+        Read the trade-history JSON the browser already fetched for the
+        modal out of the CDP network log — no extra requests and no DOM
+        walk. Returns empty columns when no matching response shows up
+        within `timeout` seconds (caller falls back to the DOM scrape).
+        """
+        records = _new_trade_columns()
+        product_id = self.product_id
+        deadline = time.time() + timeout
 
-        print(f"[scrape_trade_history] Collected {len(records)} rows.")
+        while time.time() < deadline:
+            try:
+                entries = self.driver.get_log("performance")
+            except Exception as e:
+                print(f"[collect_trades_from_cdp] performance log unavailable ({e})")
+                return records
+
+            for entry in entries:
+                try:
+                    message = json.loads(entry["message"])["message"]
+                except (KeyError, ValueError):
+                    continue
+                if message.get("method") != "Network.responseReceived":
+                    continue
+                url = message["params"]["response"].get("url", "")
+                if "/trades" not in url or product_id not in url:
+                    continue
+                try:
+                    body = self.driver.execute_cdp_cmd(
+                        "Network.getResponseBody",
+                        {"requestId": message["params"]["requestId"]},
+                    )
+                    payload = json.loads(body["body"])
+                except Exception:
+                    # Body already evicted or not JSON — skip this response
+                    continue
+                page = self._parse_trade_items(payload)
+                for column in records:
+                    records[column].extend(page[column])
+
+            if records["size"]:
+                break
+            time.sleep(0.2)
+
+        print(f"[collect_trades_from_cdp] Collected {len(records['size'])} rows.")
+        return records
+
+    def fetch_trade_history_api(self) -> TradeColumns:
+        """
+        Synchronous wrapper around `_fetch_trades_async` for callers that
+        are not running an event loop (e.g. `crawl_product`).
+        """
+        records = asyncio.run(self._fetch_trades_async())
+        print(f"[fetch_trade_history_api] Collected {len(records['size'])} rows.")
         return records
 
 
     # ---------- SAVE TO EXCEL ----------
 
     @staticmethod
-    def save_to_excel(records: List[Dict[str, str]], filename: str) -> None:
-        if not records:
+    def save_to_excel(records: TradeColumns, filename: str) -> None:
+        if not records or not records.get("size"):
             print("⚠️ No records to save.")
             return
-        df = pd.DataFrame(records)
-        df.to_excel(filename, index=False)
+
+        # Fast path: a .csv target needs no pandas at all — stream the
+        # columns straight through csv.writer (~20x faster than to_excel;
+        # utf-8-sig so Excel opens the Korean sizes correctly).
+        if filename.endswith(".csv"):
+            with open(filename, "w", newline="", encoding="utf-8-sig") as f:
+                writer = csv.writer(f, quoting=csv.QUOTE_MINIMAL)
+                writer.writerow(records.keys())
+                writer.writerows(zip(*records.values()))
+            print(f"✅ Saved {len(records['size'])} rows to {filename}")
+            return
+
+        # pandas is only imported on the .xlsx path, so csv callers skip
+        # its import cost entirely
+        import pandas as pd
+
+        df = _normalize_trade_frame(pd.DataFrame(records))
+        try:
+            # xlsxwriter is much faster than openpyxl for large histories.
+            # NOTE: constant_memory is off on purpose — pandas emits cells
+            # column-major, and constant_memory silently drops writes to
+            # already-flushed rows.
+            with pd.ExcelWriter(filename, engine="xlsxwriter") as writer:
+                df.to_excel(writer, index=False)
+        except ImportError:
+            # xlsxwriter not installed — fall back to the default engine
+            df.to_excel(filename, index=False)
         print(f"✅ Saved {len(df)} rows to {filename}")
 
 
@@ -349,33 +1028,157 @@ class KreamCrawler:
 # Convenience function
 # =============================
 
+def _crawl_product_playwright(
+    product_url: str,
+    output_file: str,
+    email: str,
+    password: str,
+) -> None:
+    """
+    Playwright variant of the crawl: same login/modal flow, but over one
+    persistent WebSocket instead of an HTTP round-trip per WebDriver
+    command, with the trade JSON captured from the modal's own XHR.
+    Requires the optional playwright package plus its chromium build.
+    """
+    try:
+        from playwright.sync_api import sync_playwright
+    except ImportError as e:
+        raise RuntimeError(
+            "backend='playwright' requires the playwright package "
+            "(pip install playwright && playwright install chromium)."
+        ) from e
+
+    records = _new_trade_columns()
+
+    def on_response(response) -> None:
+        if "/trades" not in response.url:
+            return
+        try:
+            payload = response.json()
+        except Exception:
+            return
+        page_cols = KreamCrawler._parse_trade_items(payload)
+        for column in records:
+            records[column].extend(page_cols[column])
+
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=True)
+        page = browser.new_page()
+        page.on("response", on_response)
+
+        print("[playwright] Logging in...")
+        page.goto("https://kream.co.kr/login")
+        page.fill(EMAIL_INPUT[1], email)
+        page.fill(PASSWORD_INPUT[1], password)
+        page.keyboard.press("Enter")
+        page.wait_for_url(lambda url: "/login" not in url)
+
+        print("[playwright] Opening product page and trade modal...")
+        page.goto(product_url)
+        page.wait_for_function("() => {" + CLICK_DETAILS_JS + "}")
+        page.wait_for_selector(PRICE_TABLE_CSS)
+
+        if not records["size"]:
+            # No XHR captured (e.g. served from cache) — extract from DOM
+            data = page.eval_on_selector(
+                PRICE_TABLE_CSS,
+                """el => {
+                    const rows = el.getElementsByClassName('body_list');
+                    const out = [];
+                    for (let i = 0; i < rows.length; i++) {
+                        const cells = rows[i].getElementsByTagName('span');
+                        if (cells.length < 3) continue;
+                        const texts = [
+                            cells[0].textContent.trim(),
+                            cells[1].textContent.trim(),
+                            cells[2].textContent.trim(),
+                        ];
+                        if (texts.some(Boolean)) out.push(texts);
+                    }
+                    return out;
+                }""",
+            )
+            for size, price, date in data:
+                records["size"].append(size)
+                records["price"].append(price)
+                records["date"].append(date)
+
+        browser.close()
+
+    KreamCrawler.save_to_excel(records, output_file)
+
+
 def crawl_product(
     product_url: str,
     output_file: str,
     email: str,
     password: str,
     driver: Optional[webdriver.Chrome] = None,
+    backend: str = "selenium",
 ) -> None:
 
     """
     High-level helper for other scripts (e.g., main.py).
-    Creates a driver if one isn't given, crawls, and saves to Excel.
+    Takes a driver from the warm pool if one isn't given, crawls, and
+    saves to Excel. Pass backend='playwright' to run the whole crawl on
+    Playwright instead of Selenium (no pooled driver involved).
     """
-    own_driver = False
+    if backend == "playwright":
+        _crawl_product_playwright(product_url, output_file, email, password)
+        return
+
     if driver is None:
-        own_driver = True
-        options = webdriver.ChromeOptions()
-        options.add_argument("--start-maximized")
-        driver = webdriver.Chrome(options=options)
+        with get_driver() as pooled:
+            crawl_product(product_url, output_file, email, password, driver=pooled)
+        return
+
+    crawler = KreamCrawler(driver, product_url, email, password)
 
+    # Preferred path: log in once, then hit the trades JSON endpoint
+    # directly. Falls back to the DOM scrape if the API call fails
+    # (e.g. endpoint change, anti-bot challenge).
+    records = _new_trade_columns()
     try:
-        crawler = KreamCrawler(driver, product_url, email, password)
+        crawler.login_kream(redirect_to=product_url)
+        records = crawler.fetch_trade_history_api()
+    except Exception as e:
+        print(f"[crawl_product] API scrape failed ({e}), falling back to DOM scrape.")
+
+    if not records["size"]:
         crawler.open_product_and_modal()
-        records = crawler.scrape_trade_history()
-        crawler.save_to_excel(records, output_file)
-    finally:
-        if own_driver:
-            driver.quit()
+        # The modal's own XHR is cheaper to read back than the DOM
+        records = crawler.collect_trades_from_cdp()
+        if not records["size"]:
+            records = crawler.scrape_trade_history()
+
+    crawler.save_to_excel(records, output_file)
+
+
+def crawl_products(
+    jobs: List[Tuple[str, str]],
+    email: str,
+    password: str,
+    workers: int = 4,
+) -> None:
+    """
+    Crawl several products concurrently. Each job is a
+    (product_url, output_file) pair. Workers draw warm drivers from the
+    browser pool, so a batch pays at most `workers` browser startups and
+    Selenium's network waits overlap across jobs.
+    """
+
+    def run(job: Tuple[str, str]) -> None:
+        product_url, output_file = job
+        crawl_product(product_url, output_file, email, password)
+
+    # Pre-warm the pool up to the worker count so the first wave of jobs
+    # starts scraping immediately instead of each paying a cold start.
+    while _BROWSER_POOL.qsize() < min(workers, len(jobs), _POOL_MAX_SIZE):
+        _BROWSER_POOL.put(_spawn_driver())
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # list() forces iteration so worker exceptions surface here
+        list(executor.map(run, jobs))
 
 
 